@@ -8,8 +8,18 @@ in the console, showing completion percentage based on completed vs total tasks.
 
 import os
 import sys
-from typing import List, Dict, Any
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 import asana
+import httpx
 import keyring
 import getpass
 from rich.console import Console
@@ -18,19 +28,113 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+ASANA_API_URL = "https://app.asana.com/api/1.0"
+# Maximum number of Asana API requests in flight
+MAX_CONCURRENT_REQUESTS = 20
+# Retry policy for throttled and failed requests, matching asana.Client
+MAX_RETRIES = 5
+RETRY_DELAY = 1.0
+RETRY_BACKOFF = 2.0
+MAX_WORKSPACE_WORKERS = 8
+KEEPALIVE_EXPIRY = 60
+# Asana Batch API accepts at most 10 actions per request, one per project
+BATCH_SIZE = 10
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "asana_cli", "cache.json")
+CACHE_TTL = 3600
+
+_STATUS_TYPE_TEXT = {
+    'on_track': 'On track',
+    'on_hold': 'On hold',
+    'at_risk': 'At risk',
+    'off_track': 'Off track',
+    'complete': 'Completed',
+}
+
+# Keyed by both lowercase names and the capitalized forms get_project_progress writes
+_STATUS_STYLE = {
+    'on track': "green", 'On track': "green",
+    'on hold': "blue", 'On hold': "blue",
+    'at risk': "yellow", 'At risk': "yellow",
+    'off track': "red", 'Off track': "red",
+    'completed': "bold green", 'Completed': "bold green",
+    'archived': "dim", 'Archived': "dim",
+    'no status': "white", 'No status': "white",
+    'error': "white", 'Error': "white",
+}
+
+BAR_LENGTH = 20
+# Every possible progress bar, indexed by the number of filled cells
+_BARS = tuple('█' * filled + '░' * (BAR_LENGTH - filled) for filled in range(BAR_LENGTH + 1))
+
+# Keywords used to infer a status from status update text, checked in order
+_TEXT_HINTS = (
+    ('hold', 'On hold'), ('pause', 'On hold'), ('wait', 'On hold'),
+    ('risk', 'At risk'), ('delay', 'At risk'), ('issue', 'At risk'),
+    ('off track', 'Off track'), ('problem', 'Off track'), ('red', 'Off track'),
+    ('track', 'On track'), ('progress', 'On track'), ('good', 'On track'),
+    ('complete', 'Completed'), ('done', 'Completed'),
+)
+
+
+def _is_retryable(status_code: int) -> bool:
+    """
+    Check whether a response status is worth retrying (rate limit or server error).
+    
+    Args:
+        status_code: HTTP status code
+        
+    Returns:
+        bool: True if the request should be retried
+    """
+    return status_code == 429 or 500 <= status_code < 600
+
+
+@functools.lru_cache(maxsize=1)
+def _load_api_key_from_keyring() -> Optional[str]:
+    """
+    Read the stored API key from the system keychain, once per process.
+    
+    Returns:
+        The stored API key, or None if there is none
+    """
+    return keyring.get_password("asana_cli", "api_key")
+
+
+def logout(console: Console):
+    """
+    Remove the stored API key from the system keychain.
+    
+    Args:
+        console: Console to report the result on
+    """
+    try:
+        keyring.delete_password("asana_cli", "api_key")
+        console.print("[green]✓ API key removed from keychain[/green]")
+    except keyring.errors.PasswordDeleteError:
+        console.print("[yellow]No API key stored in keychain[/yellow]")
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not remove API key from keychain: {e}[/yellow]")
+    _load_api_key_from_keyring.cache_clear()
+
+
 class AsanaProgressTracker:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         """
         Initialize the Asana progress tracker.
         
         Args:
             api_key (str): Asana API key. If None, will try to get from keychain or prompt user.
+            use_cache (bool): Reuse the workspace list cached on disk by previous runs.
+                If False, the list is fetched from Asana and the cache is refreshed.
         """
         self.console = Console()
+        self.use_cache = use_cache
+        self._memo = {}
         
         # Get API key from parameter, keychain, or prompt user
         if api_key is None:
             api_key = self._get_api_key()
+        self.api_key = api_key
         
         # Initialize Asana client
         try:
@@ -50,7 +154,7 @@ class AsanaProgressTracker:
             str: The API key
         """
         # Try to get from keychain first
-        stored_key = keyring.get_password("asana_cli", "api_key")
+        stored_key = _load_api_key_from_keyring()
         if stored_key:
             self.console.print("[green]✓ Retrieved API key from keychain[/green]")
             return stored_key
@@ -68,6 +172,7 @@ class AsanaProgressTracker:
         # Store in keychain for future use
         try:
             keyring.set_password("asana_cli", "api_key", api_key)
+            _load_api_key_from_keyring.cache_clear()
             self.console.print("[green]✓ API key stored in keychain for future use[/green]")
         except Exception as e:
             self.console.print(f"[yellow]Warning: Could not store API key in keychain: {e}[/yellow]")
@@ -75,6 +180,84 @@ class AsanaProgressTracker:
         
         return api_key
     
+    def _cached(self, name: str, fetch):
+        """
+        Return a value from the in-process or on-disk cache, fetching it on a miss.
+        
+        Disk entries are keyed by a hash of the API key and expire after CACHE_TTL seconds.
+        With use_cache off, the disk entry is not read but is still rewritten.
+        
+        Args:
+            name: Name of the cached value
+            fetch: Callable returning a JSON-serializable value
+            
+        Returns:
+            The cached or freshly fetched value
+        """
+        key = f"{hashlib.sha256(self.api_key.encode()).hexdigest()[:16]}:{name}"
+        if key in self._memo:
+            return self._memo[key]
+        
+        # Load the whole file even when not reading from it, so rewriting it
+        # keeps the entries of other API keys
+        try:
+            with open(CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        
+        if self.use_cache:
+            # Treat malformed entries as a cache miss
+            entry = cache.get(key)
+            try:
+                if time.time() - entry['time'] < CACHE_TTL:
+                    self._memo[key] = entry['value']
+                    return entry['value']
+            except (KeyError, TypeError):
+                pass
+        
+        value = fetch()
+        self._memo[key] = value
+        
+        # Always store the fresh value, so bypassing the cache also refreshes it
+        cache[key] = {'time': time.time(), 'value': value}
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            # The cache holds account data, so keep it readable by the user only
+            fd = os.open(CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                os.chmod(CACHE_FILE, 0o600)
+                json.dump(cache, f)
+        except OSError:
+            pass
+        
+        return value
+    
+    def _fetch_workspace_projects(self, workspace: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch all projects of a single workspace.
+        
+        Args:
+            workspace: Workspace dictionary from Asana API
+            
+        Returns:
+            List of project dictionaries
+        """
+        workspace_name = workspace.get('name', 'Unknown Workspace')
+        
+        # Get projects in this workspace with status field
+        projects = list(self.client.projects.find_all({
+            'workspace': workspace['gid'],
+            'opt_fields': 'name,completed,completed_at,owner,team,notes,color,created_at,due_date,start_on,archived,'
+                          'current_status_update.text,current_status_update.status_type'
+        }))
+        
+        for project in projects:
+            project['workspace_name'] = workspace_name
+        return projects
+    
     def get_all_projects(self) -> List[Dict[str, Any]]:
         """
         Fetch all projects accessible to the user.
@@ -86,22 +269,25 @@ class AsanaProgressTracker:
             self.console.print("[yellow]Fetching projects...[/yellow]")
             
             # Get all workspaces
-            workspaces = self.client.workspaces.find_all()
+            workspaces = self._cached('workspaces', lambda: list(self.client.workspaces.find_all()))
+            
+            with ThreadPoolExecutor(max_workers=MAX_WORKSPACE_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._fetch_workspace_projects, workspace): workspace
+                    for workspace in workspaces
+                }
+                
+                projects_by_workspace = {}
+                for future in as_completed(futures):
+                    workspace = futures[future]
+                    workspace_name = workspace.get('name', 'Unknown Workspace')
+                    self.console.print(f"  [blue]Scanned workspace: {workspace_name}[/blue]")
+                    projects_by_workspace[workspace['gid']] = future.result()
             
+            # Keep projects in workspace order regardless of completion order
             all_projects = []
             for workspace in workspaces:
-                workspace_name = workspace.get('name', 'Unknown Workspace')
-                self.console.print(f"  [blue]Scanning workspace: {workspace_name}[/blue]")
-                
-                # Get projects in this workspace with status field
-                projects = self.client.projects.find_all({
-                    'workspace': workspace['gid'],
-                    'opt_fields': 'name,completed,completed_at,owner,team,notes,color,created_at,due_date,start_on,archived'
-                })
-                
-                for project in projects:
-                    project['workspace_name'] = workspace_name
-                    all_projects.append(project)
+                all_projects.extend(projects_by_workspace[workspace['gid']])
             
             self.console.print(f"[green]✓ Found {len(all_projects)} projects[/green]")
             return all_projects
@@ -110,108 +296,309 @@ class AsanaProgressTracker:
             self.console.print(f"[red]Error fetching projects: {e}[/red]")
             return []
     
-    def get_project_progress(self, project: Dict[str, Any]) -> Dict[str, Any]:
+    def _retry_delay(self, retry_after: Optional[str], retry_count: int) -> float:
         """
-        Calculate progress for a specific project based on completed tasks.
+        Get how long to wait before retrying a throttled or failed request.
         
         Args:
-            project: Project dictionary from Asana API
+            retry_after: Value of the Retry-After header, if any
+            retry_count: Number of retries already made
             
         Returns:
-            Dictionary with progress information
+            Delay in seconds
         """
         try:
-            project_gid = project['gid']
-            project_name = project.get('name', 'Unnamed Project')
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return RETRY_DELAY * (RETRY_BACKOFF ** retry_count)
+    
+    async def _request(self, client: httpx.AsyncClient, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Issue a request against the Asana REST API, retrying rate-limited (429),
+        server error (5xx) and timed out requests like asana.Client does.
+        
+        Args:
+            client: Shared async HTTP client
+            method: HTTP method
+            path: API path relative to the base URL
+            **kwargs: Extra arguments for httpx (params, json)
             
-            # Get all tasks in the project
-            tasks_generator = self.client.tasks.find_by_project(project_gid, {
-                'opt_fields': 'completed,completed_at,name'
-            })
+        Returns:
+            Decoded JSON response body
+        """
+        retry_count = 0
+        while True:
+            try:
+                # Hold a slot only for the request itself, not while backing off
+                async with self._request_slots:
+                    response = await client.request(method, path, **kwargs)
+            except httpx.TimeoutException:
+                if retry_count >= MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self._retry_delay(None, retry_count))
+            else:
+                if not _is_retryable(response.status_code) or retry_count >= MAX_RETRIES:
+                    response.raise_for_status()
+                    return response.json()
+                await asyncio.sleep(self._retry_delay(response.headers.get('Retry-After'), retry_count))
+            retry_count += 1
+    
+    async def _get(self, client: httpx.AsyncClient, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Issue a GET request against the Asana REST API.
+        
+        Args:
+            client: Shared async HTTP client
+            path: API path relative to the base URL
+            params: Query parameters
             
-            # Convert generator to list
-            tasks = list(tasks_generator)
+        Returns:
+            Decoded JSON response body
+        """
+        return await self._request(client, 'GET', path, params=params)
+    
+    async def _batch_fetch(self, client: httpx.AsyncClient, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several API requests in a single call to the Asana Batch API.
+        
+        Actions that come back rate-limited or with a server error are resent
+        in a follow-up batch, up to MAX_RETRIES times.
+        
+        Args:
+            client: Shared async HTTP client
+            actions: Batch actions (at most BATCH_SIZE)
             
-            total_tasks = len(tasks)
-            completed_tasks = sum(1 for task in tasks if task.get('completed', False))
+        Returns:
+            One response dictionary (status_code, body) per action, in order
+        """
+        responses = [None] * len(actions)
+        pending = list(range(len(actions)))
+        retry_count = 0
+        while True:
+            page = await self._request(client, 'POST', '/batch',
+                                       json={'data': {'actions': [actions[i] for i in pending]}})
+            for i, action_response in zip(pending, page['data']):
+                responses[i] = action_response
             
-            # Calculate percentage
-            percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            pending = [i for i in pending if _is_retryable(responses[i]['status_code'])]
+            if not pending or retry_count >= MAX_RETRIES:
+                return responses
             
-            # Get actual project status from Asana project_statuses endpoint
-            try:
-                statuses = self.client.project_statuses.find_by_project(project_gid, {
-                    'opt_fields': 'text,color,created_at'
-                })
-                # Get the most recent status
-                if statuses:
-                    latest_status = max(statuses, key=lambda x: x.get('created_at', ''))
-                    color = latest_status.get('color', None)
-                    
-                    if color == 'green':
-                        status_text = 'On track'
-                    elif color == 'blue':
-                        status_text = 'On hold'
-                    elif color == 'yellow':
-                        status_text = 'At risk'
-                    elif color == 'red':
-                        status_text = 'Off track'
-                    elif color == 'complete':
-                        status_text = 'Completed'
-                    elif color is None:
-                        # If no color, try to infer from text
-                        text = latest_status.get('text', '').lower()
-                        if 'hold' in text or 'pause' in text or 'wait' in text:
-                            status_text = 'On hold'
-                        elif 'risk' in text or 'delay' in text or 'issue' in text:
-                            status_text = 'At risk'
-                        elif 'off track' in text or 'problem' in text or 'red' in text:
-                            status_text = 'Off track'
-                        elif 'track' in text or 'progress' in text or 'good' in text:
-                            status_text = 'On track'
-                        elif 'complete' in text or 'done' in text:
-                            status_text = 'Completed'
-                        else:
-                            status_text = 'No status'
-                    else:
-                        # Unknown color value - default to 'on hold' for now
-                        status_text = 'on hold'
-                else:
-                    status_text = 'No status'
-            except Exception as e:
-                # If we can't fetch status, fall back to basic status
-                if project.get('completed', False):
-                    status_text = 'completed'
-                elif project.get('archived', False):
-                    status_text = 'Archived'
-                else:
-                    status_text = 'Active'
+            retry_after = max(
+                self._retry_delay((responses[i].get('headers') or {}).get('Retry-After'), retry_count)
+                for i in pending
+            )
+            await asyncio.sleep(retry_after)
+            retry_count += 1
+    
+    def _count_tasks(self, page: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Count total and completed tasks in one page of results without keeping them.
+        
+        Args:
+            page: Decoded page of tasks from Asana API
+            
+        Returns:
+            Tuple of (total tasks, completed tasks)
+        """
+        total_tasks = 0
+        completed_tasks = 0
+        for task in page.get('data', []):
+            total_tasks += 1
+            completed_tasks += bool(task.get('completed', False))
+        return total_tasks, completed_tasks
+    
+    async def _count_project_tasks(self, client: httpx.AsyncClient, project_gid: str,
+                                   offset: str = None) -> Tuple[int, int]:
+        """
+        Count total and completed tasks of a project, following pagination.
+        
+        Args:
+            client: Shared async HTTP client
+            project_gid: Project identifier
+            offset: Pagination offset to start from
             
-            return {
-                'name': project_name,
-                'workspace': project.get('workspace_name', 'Unknown'),
-                'total_tasks': total_tasks,
-                'completed_tasks': completed_tasks,
-                'percentage': percentage,
-                'completed': project.get('completed', False),
-                'archived': project.get('archived', False),
-                'status': status_text,
-                'color': project.get('color', 'light-blue')
-            }
+        Returns:
+            Tuple of (total tasks, completed tasks)
+        """
+        params = {'opt_fields': 'completed', 'limit': 100}
+        total_tasks = 0
+        completed_tasks = 0
+        while True:
+            if offset:
+                params['offset'] = offset
+            page = await self._get(client, f"/projects/{project_gid}/tasks", params)
+            page_total, page_completed = self._count_tasks(page)
+            total_tasks += page_total
+            completed_tasks += page_completed
+            next_page = page.get('next_page')
+            if not next_page:
+                return total_tasks, completed_tasks
+            offset = next_page['offset']
+    
+    async def _fetch_progress_batch(self, client: httpx.AsyncClient,
+                                    projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch tasks for a group of projects with one batch request and calculate
+        their progress.
+        
+        Args:
+            client: Shared async HTTP client
+            projects: Project dictionaries from Asana API (at most BATCH_SIZE)
             
+        Returns:
+            List of progress dictionaries, in the same order as projects
+        """
+        actions = [{
+            'relative_path': f"/projects/{project['gid']}/tasks",
+            'method': 'get',
+            'options': {'fields': ['completed'], 'limit': 100}
+        } for project in projects]
+        
+        try:
+            responses = await self._batch_fetch(client, actions)
         except Exception as e:
-            self.console.print(f"[red]Error calculating progress for project {project.get('name', 'Unknown')}: {e}[/red]")
-            return {
-                'name': project.get('name', 'Unknown'),
-                'workspace': project.get('workspace_name', 'Unknown'),
-                'total_tasks': 0,
-                'completed_tasks': 0,
-                'percentage': 0,
-                'completed': project.get('completed', False),
-                'archived': project.get('archived', False),
-                'status': 'Error',
-                'color': 'red'
-            }
+            return [self._error_progress(project, e) for project in projects]
+        
+        async def count_tasks(project: Dict[str, Any], tasks_response: Dict[str, Any]) -> Tuple[int, int]:
+            if tasks_response['status_code'] != 200:
+                raise RuntimeError(f"HTTP {tasks_response['status_code']} fetching tasks")
+            
+            total_tasks, completed_tasks = self._count_tasks(tasks_response['body'])
+            next_page = tasks_response['body'].get('next_page')
+            if next_page:
+                more_total, more_completed = await self._count_project_tasks(
+                    client, project['gid'], next_page['offset'])
+                total_tasks += more_total
+                completed_tasks += more_completed
+            return total_tasks, completed_tasks
+        
+        # Follow the remaining pages of all projects in the batch concurrently
+        counts = await asyncio.gather(
+            *(count_tasks(project, tasks_response) for project, tasks_response in zip(projects, responses)),
+            return_exceptions=True
+        )
+        
+        results = []
+        for project, count in zip(projects, counts):
+            if isinstance(count, Exception):
+                results.append(self._error_progress(project, count))
+            else:
+                results.append(self.get_project_progress(project, *count))
+        
+        return results
+    
+    def _error_progress(self, project: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """
+        Report a failed progress calculation and build a placeholder result.
+        
+        Args:
+            project: Project dictionary from Asana API
+            error: The exception that occurred
+            
+        Returns:
+            Dictionary with progress information marked as an error
+        """
+        self.console.print(f"[red]Error calculating progress for project {project.get('name', 'Unknown')}: {error}[/red]")
+        return {
+            'name': project.get('name', 'Unknown'),
+            'workspace': project.get('workspace_name', 'Unknown'),
+            'total_tasks': 0,
+            'completed_tasks': 0,
+            'percentage': 0,
+            'completed': project.get('completed', False),
+            'archived': project.get('archived', False),
+            'status': 'Error',
+            'color': 'red'
+        }
+    
+    async def _fetch_all_progress(self, projects: List[Dict[str, Any]], on_done) -> List[Dict[str, Any]]:
+        """
+        Calculate progress for all projects using concurrent batch requests.
+        
+        Args:
+            projects: List of project dictionaries from Asana API
+            on_done: Callback invoked with the index of each finished batch's first project
+                in projects and the batch's progress dictionaries
+            
+        Returns:
+            List of project progress dictionaries, in the same order as projects
+        """
+        # Shared by every request made through _request, so batch POSTs and
+        # pagination GETs together stay within MAX_CONCURRENT_REQUESTS
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        project_iter = iter(projects)
+        chunks = []
+        while True:
+            chunk = list(islice(project_iter, BATCH_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        
+        async with httpx.AsyncClient(
+            base_url=ASANA_API_URL,
+            headers={'Authorization': f"Bearer {self.api_key}"},
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        ) as client:
+            async def fetch(start: int, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                progress_info = await self._fetch_progress_batch(client, chunk)
+                on_done(start, progress_info)
+                return progress_info
+            
+            batches = await asyncio.gather(*(fetch(i * BATCH_SIZE, chunk) for i, chunk in enumerate(chunks)))
+        
+        return [progress_info for batch in batches for progress_info in batch]
+    
+    def get_project_progress(self, project: Dict[str, Any], total_tasks: int, completed_tasks: int) -> Dict[str, Any]:
+        """
+        Calculate progress for a specific project based on completed tasks.
+        
+        Args:
+            project: Project dictionary from Asana API
+            total_tasks: Number of tasks in the project
+            completed_tasks: Number of completed tasks in the project
+            
+        Returns:
+            Dictionary with progress information
+        """
+        project_name = project.get('name', 'Unnamed Project')
+        
+        # Calculate percentage
+        percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        # Get actual project status from the project's latest status update
+        latest_status = project.get('current_status_update') or {}
+        if latest_status:
+            status_type = latest_status.get('status_type', None)
+            
+            if status_type in _STATUS_TYPE_TEXT:
+                status_text = _STATUS_TYPE_TEXT[status_type]
+            elif status_type is None:
+                # If no status type, try to infer from text
+                text = (latest_status.get('text') or '').lower()
+                status_text = next((status for keyword, status in _TEXT_HINTS if keyword in text), 'No status')
+            else:
+                # Unknown status type - default to 'on hold' for now
+                status_text = 'on hold'
+        else:
+            status_text = 'No status'
+        
+        return {
+            'name': project_name,
+            'workspace': project.get('workspace_name', 'Unknown'),
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'percentage': percentage,
+            'completed': project.get('completed', False),
+            'archived': project.get('archived', False),
+            'status': status_text,
+            'color': project.get('color', 'light-blue')
+        }
     
     def display_progress_bars(self, projects: List[Dict[str, Any]]):
         """
@@ -224,28 +611,41 @@ class AsanaProgressTracker:
             self.console.print("[yellow]No projects found to display.[/yellow]")
             return
         
-        # Group projects by workspace
-        workspaces = {}
-        for project in projects:
-            workspace_name = project['workspace']
-            if workspace_name not in workspaces:
-                workspaces[workspace_name] = []
-            workspaces[workspace_name].append(project)
-        
         # Display separate table for each workspace
-        for workspace_name, workspace_projects in workspaces.items():
+        for workspace_name, workspace_projects in self._group_by_workspace(projects).items():
             self._display_workspace_table(workspace_name, workspace_projects)
         
         # Display summary statistics
         self._display_summary(projects)
     
+    def _group_by_workspace(self, projects: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Group projects by workspace, each group sorted by percentage (descending).
+        
+        Projects are sorted once before grouping. The sort is stable, so ties keep
+        their position in projects and the row order is the same on every run.
+        
+        Args:
+            projects: List of project progress dictionaries, in original project order
+            
+        Returns:
+            Dictionary mapping workspace name to its projects in display order,
+            with workspaces in their original order
+        """
+        workspaces = {project['workspace']: [] for project in projects}
+        
+        for project in sorted(projects, key=itemgetter('percentage'), reverse=True):
+            workspaces[project['workspace']].append(project)
+        
+        return workspaces
+    
     def _display_workspace_table(self, workspace_name: str, projects: List[Dict[str, Any]]):
         """
         Display a table for projects in a specific workspace.
         
         Args:
             workspace_name: Name of the workspace
-            projects: List of project progress dictionaries for this workspace
+            projects: List of project progress dictionaries for this workspace, in display order
         """
         # Create a table for this workspace
         table = Table(title=f"Workspace: {workspace_name}", show_header=True, header_style="bold magenta")
@@ -254,10 +654,7 @@ class AsanaProgressTracker:
         table.add_column("Tasks", style="yellow", width=15)
         table.add_column("Status", style="white", width=15)
         
-        # Sort projects by percentage (descending)
-        sorted_projects = sorted(projects, key=lambda x: x['percentage'], reverse=True)
-        
-        for project in sorted_projects:
+        for project in projects:
             # Create progress bar
             progress_bar = self._create_progress_bar(project['percentage'])
             
@@ -287,21 +684,12 @@ class AsanaProgressTracker:
         Returns:
             str: Rich text style
         """
-        status_lower = status.lower()
-        if status_lower == 'on track':
-            return "green"
-        elif status_lower == 'on hold':
-            return "blue"
-        elif status_lower == 'at risk':
-            return "yellow"
-        elif status_lower == 'off track':
-            return "red"
-        elif status_lower == 'completed':
-            return "bold green"
-        elif 'archived' in status_lower:
-            return "dim"
-        else:
-            return "white"
+        # Statuses written by get_project_progress match exactly; lowercase only other text
+        style = _STATUS_STYLE.get(status)
+        if style is None:
+            status_lower = status.lower()
+            style = _STATUS_STYLE.get(status_lower) or ("dim" if 'archived' in status_lower else "white")
+        return style
     
     def _create_progress_bar(self, percentage: float) -> str:
         """
@@ -313,10 +701,8 @@ class AsanaProgressTracker:
         Returns:
             String representation of progress bar
         """
-        bar_length = 20
-        filled_length = int(bar_length * percentage / 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        return f"{bar} {percentage:.1f}%"
+        filled_length = int(BAR_LENGTH * percentage / 100)
+        return f"{_BARS[filled_length]} {percentage:.1f}%"
     
     def _display_summary(self, projects: List[Dict[str, Any]]):
         """
@@ -326,12 +712,18 @@ class AsanaProgressTracker:
             projects: List of project progress dictionaries
         """
         total_projects = len(projects)
-        completed_projects = sum(1 for p in projects if p['completed'])
-        active_projects = sum(1 for p in projects if not p['completed'] and not p['archived'])
-        archived_projects = sum(1 for p in projects if p['archived'])
+        completed_projects = active_projects = archived_projects = 0
+        total_tasks = completed_tasks = 0
         
-        total_tasks = sum(p['total_tasks'] for p in projects)
-        completed_tasks = sum(p['completed_tasks'] for p in projects)
+        # Single pass over the projects for all counters
+        for p in projects:
+            completed = bool(p['completed'])
+            archived = bool(p['archived'])
+            completed_projects += completed
+            archived_projects += archived
+            active_projects += not completed and not archived
+            total_tasks += p['total_tasks']
+            completed_tasks += p['completed_tasks']
         overall_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
         summary_text = f"""
@@ -367,7 +759,13 @@ class AsanaProgressTracker:
         
         # Calculate progress for each project
         self.console.print("[yellow]Calculating project progress...[/yellow]")
-        project_progress = []
+        
+        # Track unfinished projects per workspace so each table is shown as soon as it is complete
+        indexes_by_workspace = {}
+        for i, project in enumerate(projects):
+            indexes_by_workspace.setdefault(project.get('workspace_name', 'Unknown'), []).append(i)
+        pending_by_workspace = {name: len(indexes) for name, indexes in indexes_by_workspace.items()}
+        results = [None] * len(projects)
         
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -376,26 +774,48 @@ class AsanaProgressTracker:
         ) as progress:
             task = progress.add_task("Processing projects...", total=len(projects))
             
-            for project in projects:
-                progress_info = self.get_project_progress(project)
-                project_progress.append(progress_info)
-                progress.advance(task)
+            def on_batch_done(start: int, batch: List[Dict[str, Any]]):
+                progress.advance(task, len(batch))
+                results[start:start + len(batch)] = batch
+                for progress_info in batch:
+                    workspace_name = progress_info['workspace']
+                    pending_by_workspace[workspace_name] -= 1
+                    if not pending_by_workspace[workspace_name]:
+                        # Gathered in original project order so the stable sort keeps ties in place
+                        workspace_results = [results[i] for i in indexes_by_workspace[workspace_name]]
+                        self._display_workspace_table(
+                            workspace_name,
+                            sorted(workspace_results, key=itemgetter('percentage'), reverse=True)
+                        )
+            
+            project_progress = asyncio.run(self._fetch_all_progress(projects, on_batch_done))
         
-        # Display the results
-        self.display_progress_bars(project_progress)
+        # Display summary statistics
+        self._display_summary(project_progress)
 
 
 def main():
     """
     Main function to run the Asana progress tracker.
     """
+    parser = argparse.ArgumentParser(description="Display progress bars for all your Asana projects.")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Fetch the workspace list from Asana and refresh the cache")
+    parser.add_argument('--logout', action='store_true',
+                        help="Remove the stored API key from the keychain and exit")
+    args = parser.parse_args()
+    
     console = Console()
     
+    if args.logout:
+        logout(console)
+        return
+    
     console.print("[bold blue]Asana Project Progress Tracker[/bold blue]")
     console.print("This tool will display progress bars for all your Asana projects.\n")
     
     # Create and run the tracker (API key will be retrieved from keychain or prompted)
-    tracker = AsanaProgressTracker()
+    tracker = AsanaProgressTracker(use_cache=not args.no_cache)
     tracker.run()
 
 